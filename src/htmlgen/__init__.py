@@ -1,26 +1,45 @@
 from __future__ import annotations
 
+import enum
 import html
+import io
 import logging
 import re
+import sys
 import textwrap
 import unittest
 from abc import ABCMeta, abstractmethod
-from collections.abc import Iterable, Mapping
+from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import dataclass, field
-from functools import wraps
-from typing import Callable, Self, TypeVar, cast
+from functools import lru_cache, wraps
+from typing import Callable, Self, TextIO, TypeVar, cast
 
 logger = logging.getLogger(__name__)
 
 
 DATA_KEY_PATTERN = re.compile("[a-z][a-z-]*")
+# Matches newline-separated data keys, so that all keys can be checked at once
+_DATA_KEYS_PATTERN = re.compile("[a-z][a-z-]*(?:\n[a-z][a-z-]*)*")
 
 
 class HtmlRenderable(metaclass=ABCMeta):
+    __slots__ = ()
+
     @abstractmethod
     def render(self, indent: str, inline: bool) -> str: ...
 
+    def render_to(self, out: TextIO, indent: str, inline: bool) -> None:
+        """
+        Write the rendered HTML to out piece by piece.
+
+        This produces the same output as render() without building the whole
+        document as one string first.
+        """
+        self._render_into(out.write, indent, inline)
+
+    def _render_into(self, write: Writer, indent: str, inline: bool) -> None:
+        write(self.render(indent=indent, inline=inline))
+
     @property
     @abstractmethod
     def must_be_inline(self) -> bool: ...
@@ -34,18 +53,31 @@ class HtmlRenderable(metaclass=ABCMeta):
         return self
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class Element(HtmlRenderable):
     type: str
     attributes: dict[str, str | None] = field(default_factory=dict)
     children: list[HtmlRenderable] = field(default_factory=list)
-    classes: set[str] = field(default_factory=set)
+    # Used as an insertion-ordered set
+    classes: dict[str, None] = field(default_factory=dict)
+    # State captured by seal() and used by rendering while the element is sealed:
+    # a snapshot of the children, whether any of them must be inline, and the
+    # rendered attribute string. Unsealed elements compute these on every render.
+    _sealed_children: tuple[HtmlRenderable, ...] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _inline_children: bool = field(default=False, init=False, repr=False, compare=False)
+    _rendered_attrs: str = field(default="", init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
+        # Tag names are looked up in the element sets on every render. Interning
+        # lets those lookups succeed on identity for runtime-built names. Only
+        # exact strs can be interned; subclasses such as StrEnum are left as is.
+        if type(self.type) is str:
+            self.type = sys.intern(self.type)
         if (class_str := self.attributes.get("class")) is not None:
             logger.warning("class set as an attribute!", stack_info=True, stacklevel=3)
-            for classname in class_str.split():
-                self.classes.add(classname)
+            self.classes.update(dict.fromkeys(class_str.split()))
             del self.attributes["class"]
 
     @property
@@ -57,64 +89,159 @@ class Element(HtmlRenderable):
         return self.type in VOID_ELEMENTS
 
     def containing(self, *items: Contents) -> Element:
+        self._sealed_children = None
         self.children.extend(HtmlStr(i) if isinstance(i, str) else i for i in items)
         return self
 
+    def seal(self) -> Element:
+        """
+        Prepare this element and its descendants for repeated rendering.
+
+        Each element's children, inline layout, and rendered attributes are
+        captured once and reused by every later render. Sealing is a promise
+        that the tree is done changing: edits made directly to children,
+        attributes, or classes afterwards are not picked up. Calling
+        containing() or a with_*() method on a sealed element unseals it.
+        """
+        stack: list[HtmlRenderable] = [self]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, Element):
+                children = node._sealed_children = tuple(node.children)
+                node._inline_children = any(c.must_be_inline for c in children)
+                node._rendered_attrs = _element_attributes(
+                    node.attributes, node.classes
+                )
+                stack.extend(children)
+            elif isinstance(node, HtmlSequence):
+                stack.extend(node.children)
+        return self
+
     def with_attribute(self, **attributes: str | None) -> Element:
         self.attributes.update(attributes)
+        self._sealed_children = None
         return self
 
     def with_class(self, *classnames: str) -> Element:
-        self.classes.update(classnames)
+        self.classes.update(dict.fromkeys(classnames))
+        self._sealed_children = None
         return self
 
     def with_data(self, data: dict[str, str]) -> Element:
-        for key in data:
-            if not DATA_KEY_PATTERN.fullmatch(key):
-                raise ValueError(
-                    f"data key {key!r} doesn't match /{DATA_KEY_PATTERN.pattern}/"
-                )
-        self.attributes.update((f"data-{key}", value) for key, value in data.items())
+        keys = "\n".join(data)
+        # Checking the count catches keys that themselves contain a newline
+        if data and (
+            not _DATA_KEYS_PATTERN.fullmatch(keys) or keys.count("\n") != len(data) - 1
+        ):
+            for key in data:
+                if not DATA_KEY_PATTERN.fullmatch(key):
+                    raise ValueError(
+                        f"data key {key!r} doesn't match /{DATA_KEY_PATTERN.pattern}/"
+                    )
+        self.attributes.update(
+            (sys.intern(f"data-{key}"), value) for key, value in data.items()
+        )
+        self._sealed_children = None
         return self
 
     def render(self, indent: str, inline: bool) -> str:
-        inline = self.must_be_inline or any(c.must_be_inline for c in self.children)
-        if self.void:
-            contents = None
-        elif inline:
-            contents = "".join(c.render(indent="", inline=True) for c in self.children)
-        else:
-            contents = "\n".join(
-                c.render(indent=indent + "  ", inline=False) for c in self.children
-            )
-        return render_tag(
-            type=self.type,
-            attrs=self.attributes,
-            classes=self.classes,
-            contents=contents,
-            indent=indent,
-            inline=inline,
-        )
-
-
-@dataclass(frozen=True)
+        buf: list[str] = []
+        self._render_into(buf.append, indent, inline)
+        return "".join(buf)
+
+    def _render_into(self, write: Writer, indent: str, inline: bool) -> None:
+        # Pre-order walk with an explicit stack instead of recursion. The stack
+        # holds either nodes still to be rendered or literal fragments (closing
+        # tags and separators) to be emitted once the preceding nodes are done.
+        stack: list[str | tuple[HtmlRenderable, str, bool]] = [(self, indent, inline)]
+        warn_unknown = logger.isEnabledFor(logging.WARNING)
+        # Bound methods are hoisted out of the loop to avoid repeated lookups
+        push = stack.append
+        pop = stack.pop
+        while stack:
+            item = pop()
+            if isinstance(item, str):
+                write(item)
+                continue
+            node, indent, inline = item
+            if isinstance(node, HtmlSequence):
+                if inline:
+                    stack.extend(
+                        [(member, "", True) for member in reversed(node.children)]
+                    )
+                else:
+                    for i, member in enumerate(reversed(node.children)):
+                        if i:
+                            push("\n")
+                        push((member, indent, False))
+                continue
+            if not isinstance(node, Element):
+                node._render_into(write, indent, inline)
+                continue
+
+            type = node.type
+            sealed = node._sealed_children
+            if sealed is None:
+                children: Sequence[HtmlRenderable] = node.children
+                inline = any(c.must_be_inline for c in children)
+                rendered_attrs = _element_attributes(node.attributes, node.classes)
+            else:
+                children = sealed
+                inline = node._inline_children
+                rendered_attrs = node._rendered_attrs
+            if warn_unknown and type not in ALL_ELEMENTS:
+                logger.warning("unknown tag type %r", type)
+            if type in NO_INDENT_ELEMENTS:
+                tag_indent = ""
+                tag_inline = True
+            else:
+                tag_indent = indent
+                tag_inline = inline
+            if type in VOID_ELEMENTS:
+                write(f"{tag_indent}<{type}{rendered_attrs}/>")
+                continue
+            write(f"{tag_indent}<{type}{rendered_attrs}>")
+            close_tag = _CLOSE_TAGS.get(type) or f"</{type}>"
+            if tag_inline:
+                push(close_tag)
+            else:
+                write("\n")
+                stack.extend((close_tag, tag_indent, "\n"))
+            if inline:
+                stack.extend([(child, "", True) for child in reversed(children)])
+            else:
+                child_indent = indent + "  "
+                for i, child in enumerate(reversed(children)):
+                    if i:
+                        push("\n")
+                    push((child, child_indent, False))
+
+
+@dataclass(frozen=True, slots=True)
 class HtmlSequence(HtmlRenderable):
     children: list[Element]
 
     def render(self, indent: str, inline: bool) -> str:
+        buf: list[str] = []
+        self._render_into(buf.append, indent, inline)
+        return "".join(buf)
+
+    def _render_into(self, write: Writer, indent: str, inline: bool) -> None:
         if inline:
-            return "".join(c.render(indent="", inline=True) for c in self.children)
+            for c in self.children:
+                c._render_into(write, "", True)
         else:
-            return "\n".join(
-                c.render(indent=indent, inline=False) for c in self.children
-            )
+            for i, c in enumerate(self.children):
+                if i:
+                    write("\n")
+                c._render_into(write, indent, False)
 
     @property
     def must_be_inline(self) -> bool:
         return any(c.must_be_inline for c in self.children)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HtmlStr(HtmlRenderable):
     s: str
 
@@ -129,6 +256,10 @@ class HtmlStr(HtmlRenderable):
     def render(self, indent: str, inline: bool) -> str:
         return indent + self.s
 
+    def _render_into(self, write: Writer, indent: str, inline: bool) -> None:
+        write(indent)
+        write(self.s)
+
 
 TElementFunc = TypeVar("TElementFunc", bound=Callable[..., Element])
 
@@ -136,12 +267,22 @@ TElementFunc = TypeVar("TElementFunc", bound=Callable[..., Element])
 class Registry:
     def __init__(self) -> None:
         self.styles: dict[str, str] = {}
+        # The last rendered stylesheet and the styles it was rendered from, so
+        # that changes are picked up however styles was modified
+        self._stylesheet = ""
+        self._stylesheet_key: tuple[tuple[str, str], ...] = ()
 
     def render_stylesheet(self) -> str:
-        return "\n".join(
-            f".{name} {{\n{textwrap.indent(style, '  ')}\n}}"
-            for name, style in self.styles.items()
-        )
+        key = tuple(self.styles.items())
+        if key != self._stylesheet_key:
+            self._stylesheet = "\n".join(
+                [
+                    f".{name} {{\n{textwrap.indent(style, '  ')}\n}}"
+                    for name, style in key
+                ]
+            )
+            self._stylesheet_key = key
+        return self._stylesheet
 
     def style(self, css: str | None = None) -> Callable[[TElementFunc], TElementFunc]:
         """
@@ -163,7 +304,12 @@ class Registry:
             @wraps(func)
             def wrapper(*args, **kwargs):
                 result = func(*args, **kwargs)
-                result.with_class(classname)
+                if type(result) is Element:
+                    # Same as with_class(), without the call and argument packing
+                    result.classes[classname] = None
+                    result._sealed_children = None
+                else:
+                    result.with_class(classname)
                 return result
 
             return cast(TElementFunc, wrapper)
@@ -173,6 +319,7 @@ class Registry:
 
 Attributes = Mapping[str, str | bool | None]
 Contents = HtmlRenderable | str
+Writer = Callable[[str], object]
 
 
 def render_tag(
@@ -199,10 +346,21 @@ def render_tag(
         return f"{indent}{open_tag}\n{contents}\n{indent}{close_tag}"
 
 
-def render_attributes(attrs: Attributes = {}, classes: Iterable[str] = []) -> str:
+def render_attributes(
+    attrs: Attributes | None = None,
+    classes: Iterable[str] = (),
+    # Bound as defaults so the loop below uses fast local lookups. html.escape()
+    # is a handful of str.replace() calls, each a C-level scan that returns the
+    # input unchanged when there is nothing to replace; it benchmarks faster than
+    # a single str.translate() pass, with or without a regex pre-check.
+    _escape: Callable[[str], str] = html.escape,
+    _join: Callable[[Iterable[str]], str] = " ".join,
+) -> str:
+    if attrs is None:
+        attrs = {}
     rendered_attrs = []
     if classes:
-        class_value = " ".join(html.escape(c) for c in classes)
+        class_value = _join([_escape(c) for c in classes])
         rendered_attrs.append(f'class="{class_value}"')
     for name, value in attrs.items():
         if value is False or value is None:
@@ -210,135 +368,163 @@ def render_attributes(attrs: Attributes = {}, classes: Iterable[str] = []) -> st
         elif value is True:
             rendered_attrs.append(name)
         else:
-            rendered_attrs.append(f'{name}="{html.escape(value)}"')
-    return "".join(f" {r}" for r in rendered_attrs)
-
-
-NO_INDENT_ELEMENTS = {
-    "pre",
-}
-
-VOID_ELEMENTS = {
-    "area",
-    "base",
-    "br",
-    "col",
-    "embed",
-    "hr",
-    "img",
-    "input",
-    "link",
-    "meta",
-    "source",
-    "track",
-    "wbr",
-}
-
-ALL_ELEMENTS = {
-    "article",
-    "section",
-    "nav",
-    "aside",
-    "h1",
-    "h2",
-    "h3",
-    "h4",
-    "h5",
-    "h6",
-    "hgroup",
-    "header",
-    "footer",
-    "address",
-    "p",
-    "hr",
-    "pre",
-    "blockquote",
-    "ol",
-    "ul",
-    "menu",
-    "li",
-    "dl",
-    "dt",
-    "dd",
-    "figure",
-    "figcaption",
-    "main",
-    "div",
-    "a",
-    "em",
-    "strong",
-    "small",
-    "s",
-    "cite",
-    "q",
-    "dfn",
-    "abbr",
-    "ruby",
-    "rt",
-    "rp",
-    "data",
-    "time",
-    "code",
-    "var",
-    "samp",
-    "kbd",
-    "sub",
-    "sup",
-    "i",
-    "b",
-    "u",
-    "mark",
-    "bdi",
-    "bdo",
-    "span",
-    "br",
-    "wbr",
-    "ins",
-    "del",
-    "picture",
-    "source",
-    "img",
-    "iframe",
-    "embed",
-    "object",
-    "video",
-    "audio",
-    "track",
-    "map",
-    "area",
-    "table",
-    "caption",
-    "colgroup",
-    "col",
-    "tbody",
-    "thead",
-    "tfoot",
-    "tr",
-    "td",
-    "th",
-    "form",
-    "label",
-    "input",
-    "button",
-    "select",
-    "datalist",
-    "optgroup",
-    "option",
-    "textarea",
-    "output",
-    "progress",
-    "meter",
-    "fieldset",
-    "legend",
-    "details",
-    "summary",
-    "dialog",
-    "script",
-    "noscript",
-    "template",
-    "slot",
-    "canvas",
-}
+            rendered_attrs.append(f'{name}="{_escape(value)}"')
+    return " " + _join(rendered_attrs) if rendered_attrs else ""
+
+
+def _element_attributes(attrs: Attributes, classes: Iterable[str]) -> str:
+    # Most elements have no attributes at all, which isn't worth a cache lookup
+    if not attrs and not classes:
+        return ""
+    return _cached_render_attributes(tuple(attrs.items()), tuple(classes))
+
+
+@lru_cache(maxsize=4096)
+def _cached_render_attributes(
+    attrs: tuple[tuple[str, str | bool | None], ...], classes: tuple[str, ...]
+) -> str:
+    """
+    Memoized render_attributes(), keyed on the raw attribute items and classes.
+
+    Pages built from components repeat the same attributes and classes many
+    times, so elements share the rendered strings.
+    """
+    return render_attributes(dict(attrs), classes)
+
+
+NO_INDENT_ELEMENTS = frozenset(
+    {
+        "pre",
+    }
+)
+
+VOID_ELEMENTS = frozenset(
+    {
+        "area",
+        "base",
+        "br",
+        "col",
+        "embed",
+        "hr",
+        "img",
+        "input",
+        "link",
+        "meta",
+        "source",
+        "track",
+        "wbr",
+    }
+)
+
+ALL_ELEMENTS = frozenset(
+    {
+        "article",
+        "section",
+        "nav",
+        "aside",
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        "h5",
+        "h6",
+        "hgroup",
+        "header",
+        "footer",
+        "address",
+        "p",
+        "hr",
+        "pre",
+        "blockquote",
+        "ol",
+        "ul",
+        "menu",
+        "li",
+        "dl",
+        "dt",
+        "dd",
+        "figure",
+        "figcaption",
+        "main",
+        "div",
+        "a",
+        "em",
+        "strong",
+        "small",
+        "s",
+        "cite",
+        "q",
+        "dfn",
+        "abbr",
+        "ruby",
+        "rt",
+        "rp",
+        "data",
+        "time",
+        "code",
+        "var",
+        "samp",
+        "kbd",
+        "sub",
+        "sup",
+        "i",
+        "b",
+        "u",
+        "mark",
+        "bdi",
+        "bdo",
+        "span",
+        "br",
+        "wbr",
+        "ins",
+        "del",
+        "picture",
+        "source",
+        "img",
+        "iframe",
+        "embed",
+        "object",
+        "video",
+        "audio",
+        "track",
+        "map",
+        "area",
+        "table",
+        "caption",
+        "colgroup",
+        "col",
+        "tbody",
+        "thead",
+        "tfoot",
+        "tr",
+        "td",
+        "th",
+        "form",
+        "label",
+        "input",
+        "button",
+        "select",
+        "datalist",
+        "optgroup",
+        "option",
+        "textarea",
+        "output",
+        "progress",
+        "meter",
+        "fieldset",
+        "legend",
+        "details",
+        "summary",
+        "dialog",
+        "script",
+        "noscript",
+        "template",
+        "slot",
+        "canvas",
+    }
+)
+
+_CLOSE_TAGS = {name: f"</{name}>" for name in ALL_ELEMENTS}
 
 
 class Tests(unittest.TestCase):
@@ -416,3 +602,183 @@ class Tests(unittest.TestCase):
             .render(indent="", inline=False)
         )
         self.assertMultiLineEqual(result, "<div>\n  <p>foo</p>\n  <p>bar</p>\n</div>")
+
+    def test_deeply_nested_elements(self) -> None:
+        root = leaf = Element("div")
+        for _ in range(5000):
+            child = Element("div")
+            leaf.containing(child)
+            leaf = child
+        leaf.containing("x")
+        result = root.render(indent="", inline=False)
+        self.assertTrue(result.startswith("<div>\n  <div>\n    <div>\n"))
+        self.assertTrue(result.endswith("\n    </div>\n  </div>\n</div>"))
+        self.assertEqual(result.count("<div>"), 5001)
+
+    def test_attributes_stored_raw(self) -> None:
+        element = (
+            Element("a", attributes={"title": "<x>"})
+            .with_attribute(href="/?a=1&b=2")
+            .with_data({"q": '"'})
+            .with_class("a&b")
+            .containing("x")
+        )
+        self.assertEqual(element.attributes["title"], "<x>")
+        self.assertIn("a&b", element.classes)
+        element.with_attribute(title=f"{element.attributes['title']}!")
+        expected = (
+            '<a class="a&amp;b" title="&lt;x&gt;!" href="/?a=1&amp;b=2"'
+            ' data-q="&quot;">x</a>'
+        )
+        self.assertEqual(element.render(indent="", inline=False), expected)
+        self.assertEqual(element.render(indent="", inline=False), expected)
+
+    def test_render_stylesheet(self) -> None:
+        registry = Registry()
+
+        @registry.style("""
+            color: red;
+        """)
+        def first() -> Element:
+            return Element("div")
+
+        self.assertEqual(registry.render_stylesheet(), ".first {\n  color: red;\n}")
+
+        @registry.style("""
+            color: blue;
+        """)
+        def second_() -> Element:
+            return Element("div")
+
+        self.assertEqual(
+            registry.render_stylesheet(),
+            ".first {\n  color: red;\n}\n.second {\n  color: blue;\n}",
+        )
+
+    def test_seal(self) -> None:
+        element = Element("ul").containing(Element("li").containing("a"))
+        self.assertIs(element.seal(), element)
+        self.assertIsInstance(element._sealed_children, tuple)
+        self.assertEqual(
+            element.render(indent="", inline=False), "<ul>\n  <li>a</li>\n</ul>"
+        )
+        element.containing(Element("li").containing("b"))
+        self.assertEqual(
+            element.render(indent="", inline=False),
+            "<ul>\n  <li>a</li>\n  <li>b</li>\n</ul>",
+        )
+
+    def test_class_order(self) -> None:
+        element = Element("p").with_class("z", "a").with_class("m", "z").containing("x")
+        self.assertEqual(
+            element.render(indent="", inline=False), '<p class="z a m">x</p>'
+        )
+
+    def test_with_data(self) -> None:
+        element = Element("div").with_data({"a": "1", "b-c": "2"}).containing("x")
+        self.assertEqual(
+            element.render(indent="", inline=False),
+            '<div data-a="1" data-b-c="2">x</div>',
+        )
+        for key in ["B", "a\nb", "1", "-a", ""]:
+            with self.subTest(key=key), self.assertRaises(ValueError):
+                Element("div").with_data({"a": "1", key: "2"})
+
+    def test_render_to(self) -> None:
+        document = HtmlSequence(
+            [
+                Element("h1").containing("Title"),
+                Element("div").containing(Element("p").containing("text")),
+            ]
+        )
+        out = io.StringIO()
+        document.render_to(out, indent="", inline=False)
+        self.assertEqual(out.getvalue(), document.render(indent="", inline=False))
+
+    def test_rerender_after_changes(self) -> None:
+        element = Element("p").containing("x")
+        self.assertEqual(element.render(indent="", inline=False), "<p>x</p>")
+        element.with_class("a")
+        self.assertEqual(element.render(indent="", inline=False), '<p class="a">x</p>')
+        element.with_attribute(id="b")
+        self.assertEqual(
+            element.render(indent="", inline=False), '<p class="a" id="b">x</p>'
+        )
+        element.with_data({"c": "d"})
+        self.assertEqual(
+            element.render(indent="", inline=False),
+            '<p class="a" id="b" data-c="d">x</p>',
+        )
+
+    def test_raw_and_escaped_attributes_render_independently(self) -> None:
+        escaped = Element("p").with_attribute(title="<").containing("x")
+        self.assertEqual(
+            escaped.render(indent="", inline=False), '<p title="&lt;">x</p>'
+        )
+        raw = Element("p").containing("x")
+        raw.attributes["title"] = "&lt;"
+        self.assertEqual(
+            raw.render(indent="", inline=False), '<p title="&amp;lt;">x</p>'
+        )
+
+    def test_style_on_non_element(self) -> None:
+        registry = Registry()
+
+        @registry.style()
+        def text():  # not an Element, so with_class() is ignored
+            return HtmlStr("x")
+
+        with self.assertLogs(logger, logging.WARNING):
+            self.assertEqual(text(), HtmlStr("x"))
+
+    def test_direct_child_changes(self) -> None:
+        element = Element("p")
+        element.children.append(HtmlStr("x"))
+        self.assertEqual(element.render(indent="", inline=False), "<p>x</p>")
+        self.assertEqual(element.seal().render(indent="", inline=False), "<p>x</p>")
+
+    def test_str_subclass_tag(self) -> None:
+        class Tag(enum.StrEnum):
+            P = "p"
+
+        element = Element(Tag.P).containing("x")
+        self.assertEqual(element.render(indent="", inline=False), "<p>x</p>")
+
+    def test_rerender_after_reassigning_fields(self) -> None:
+        element = Element("p", attributes={"id": "a"}).containing("x")
+        self.assertEqual(element.render(indent="", inline=False), '<p id="a">x</p>')
+        element.type = "span"
+        element.attributes = {"title": "<"}
+        element.classes = {"b": None}
+        self.assertEqual(
+            element.render(indent="", inline=False),
+            '<span class="b" title="&lt;">x</span>',
+        )
+
+    def test_rerender_after_direct_attribute_edits(self) -> None:
+        element = Element("a").containing("x")
+        element.render(indent="", inline=False)
+        element.attributes["href"] = "/next"
+        self.assertEqual(
+            element.render(indent="", inline=False), '<a href="/next">x</a>'
+        )
+        element.seal()
+        element.with_class("c")
+        self.assertEqual(
+            element.render(indent="", inline=False),
+            '<a class="c" href="/next">x</a>',
+        )
+
+    def test_render_stylesheet_after_direct_edit(self) -> None:
+        registry = Registry()
+
+        @registry.style("""
+            color: red;
+        """)
+        def box() -> Element:
+            return Element("div")
+
+        self.assertEqual(registry.styles["box"], "color: red;")
+        self.assertEqual(registry.render_stylesheet(), ".box {\n  color: red;\n}")
+        registry.styles["box"] = "color: blue;"
+        self.assertEqual(registry.render_stylesheet(), ".box {\n  color: blue;\n}")